@@ -0,0 +1,165 @@
+import streamlit as st
+import pandas as pd
+from pathlib import Path
+import unicodedata
+
+# XLSX 읽기 엔진 (pandas 2.2 이상에 python-calamine이 있으면 우선 사용, 없으면 openpyxl)
+try:
+    import python_calamine  # noqa: F401
+    PANDAS_VERSION = tuple(int(v) for v in pd.__version__.split('.')[:2])
+    XLSX_READ_ENGINE = "calamine" if PANDAS_VERSION >= (2, 2) else "openpyxl"
+except ImportError:
+    XLSX_READ_ENGINE = "openpyxl"
+
+# 학교별 EC 설정
+SCHOOL_EC = {
+    "송도고": {"ec": 1.0, "color": "#4A90E2"},
+    "하늘고": {"ec": 2.0, "color": "#50C878"},
+    "아라고": {"ec": 4.0, "color": "#FFB347"},
+    "동산고": {"ec": 8.0, "color": "#FF6B6B"}
+}
+COLOR_MAP = {school: info['color'] for school, info in SCHOOL_EC.items()}
+SCHOOL_DTYPE = pd.CategoricalDtype(list(SCHOOL_EC.keys()))
+
+# 환경 데이터 측정값 자료형
+ENV_DTYPES = {'temperature': 'float32', 'humidity': 'float32', 'ph': 'float32', 'ec': 'float32'}
+
+def list_data_files(data_dir):
+    """폴더 내 (NFC 정규화된 파일명, 경로) 목록"""
+    return [(unicodedata.normalize("NFC", p.name), p) for p in data_dir.iterdir()]
+
+def match_school(name):
+    """NFC 정규화된 이름에 포함된 학교명 반환"""
+    return next((school for school in SCHOOL_EC if school in name), None)
+
+def file_key(path):
+    """캐시 키로 쓸 (절대 경로, 수정 시각)"""
+    return str(path.resolve()), path.stat().st_mtime
+
+@st.cache_data(persist="disk", show_spinner=False)
+def read_environment_csv(csv_path, mtime):
+    """환경 CSV 한 개 읽기 (경로/수정 시각이 캐시 키, 실패 시 예외 발생)"""
+    try:
+        return pd.read_csv(csv_path, encoding='utf-8-sig', dtype=ENV_DTYPES)
+    except Exception:
+        return pd.read_csv(csv_path, encoding='cp949', dtype=ENV_DTYPES)
+
+@st.cache_data(persist="disk", show_spinner=False)
+def read_growth_workbook(excel_path, mtime):
+    """생육 결과 엑셀의 모든 시트 읽기, 결합 및 학교별 집계 (경로/수정 시각이 캐시 키)"""
+    sheets = pd.read_excel(excel_path, sheet_name=None, engine=XLSX_READ_ENGINE)
+    growth_data = {}
+    
+    for sheet_name, df in sheets.items():
+        # 시트명에 학교명 포함 여부 확인
+        school = match_school(unicodedata.normalize("NFC", sheet_name))
+        if school is not None:
+            growth_data[school] = df
+    
+    if not growth_data:
+        return growth_data, None, None
+    growth_long_df = growth_long(growth_data)
+    return growth_data, growth_long_df, compute_growth_summary(growth_long_df)
+
+@st.cache_data(show_spinner=False)
+def summarize_environment_files(files):
+    """학교별 환경 평균 집계 (files: (학교, 경로, 수정 시각) 튜플이 캐시 키)"""
+    env_data = {school: read_environment_csv(path, mtime) for school, path, mtime in files}
+    return compute_env_summary(env_data)
+
+def load_environment_data():
+    """환경 데이터 로딩 (반환: (학교별 데이터, 학교별 평균), 실패 시 (None, None))"""
+    data_dir = Path("data")
+    
+    if not data_dir.exists():
+        st.error(f"data 폴더가 없습니다. 현재 위치: {Path.cwd()}")
+        return None, None
+    
+    # 모든 파일 나열
+    all_files = list_data_files(data_dir)
+    csv_files = [(name, f) for name, f in all_files if f.suffix.lower() == '.csv']
+    
+    if not csv_files:
+        st.error(f"CSV 파일이 없습니다. 폴더 내 파일: {[name for name, _ in all_files]}")
+        return None, None
+    
+    # 각 CSV 파일 처리 (실패한 파일은 캐시되지 않고 건너뜀)
+    env_data = {}
+    loaded_files = []
+    for fname, csv_path in csv_files:
+        # 매칭 확인
+        school = match_school(fname)
+        if school is None:
+            continue
+        
+        try:
+            key = file_key(csv_path)
+            env_data[school] = read_environment_csv(*key)
+            loaded_files.append((school, *key))
+        except Exception as e:
+            st.warning(f"{csv_path.name} 로딩 실패: {e}")
+    
+    if len(env_data) == 0:
+        return None, None
+    return env_data, summarize_environment_files(tuple(loaded_files))
+
+def load_growth_data():
+    """생육 결과 데이터 로딩 (반환: (학교별 데이터, 결합 데이터, 학교별 평균), 실패 시 모두 None)"""
+    data_dir = Path("data")
+    
+    if not data_dir.exists():
+        st.error("data 폴더가 없습니다.")
+        return None, None, None
+    
+    # 엑셀 파일 찾기
+    all_files = list_data_files(data_dir)
+    excel_files = [f for _, f in all_files if f.suffix.lower() in ['.xlsx', '.xls']]
+    
+    if not excel_files:
+        st.error(f"엑셀 파일이 없습니다. 폴더 내 파일: {[name for name, _ in all_files]}")
+        return None, None, None
+    
+    # 첫 번째 엑셀 파일 사용
+    excel_path = excel_files[0]
+    
+    try:
+        # 모든 시트 읽기 (실패 시 예외는 캐시되지 않음)
+        growth_data, growth_long_df, growth_stats = read_growth_workbook(*file_key(excel_path))
+        if len(growth_data) == 0:
+            return None, None, None
+        return growth_data, growth_long_df, growth_stats
+        
+    except Exception as e:
+        st.error(f"엑셀 파일 읽기 실패: {e}")
+        return None, None, None
+
+def env_all(env_data):
+    """학교별 환경 데이터를 하나의 데이터프레임으로 결합"""
+    return (pd.concat(env_data, names=['school'])
+            .reset_index(level='school')
+            .reset_index(drop=True)
+            .astype({'school': SCHOOL_DTYPE}))
+
+def compute_env_summary(env_data):
+    """학교별 환경 평균 집계"""
+    columns = {'temperature': '평균 온도', 'humidity': '평균 습도', 'ph': '평균 pH', 'ec': '평균 EC'}
+    return (env_all(env_data)
+            .groupby('school', observed=True, sort=False)[list(columns)]
+            .mean()
+            .rename(columns=columns))
+
+def growth_long(growth_data):
+    """학교별 생육 데이터를 하나의 데이터프레임으로 결합"""
+    return (pd.concat(growth_data, names=['school'])
+            .reset_index(level='school')
+            .reset_index(drop=True)
+            .astype({'school': SCHOOL_DTYPE}))
+
+def compute_growth_summary(growth_long_df):
+    """학교별 생육 평균 집계"""
+    return growth_long_df.groupby('school', observed=True, sort=False).agg(**{
+        '평균 생중량': ('생중량(g)', 'mean'),
+        '평균 잎 수': ('잎 수(장)', 'mean'),
+        '평균 지상부 길이': ('지상부 길이(mm)', 'mean'),
+        '개체수': ('생중량(g)', 'size'),
+    })
@@ -1,11 +1,24 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
+import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 from pathlib import Path
-import unicodedata
 import io
 
+from data_loader import (
+    SCHOOL_EC, COLOR_MAP,
+    load_environment_data, load_growth_data,
+)
+
+# XLSX 저장 엔진 (xlsxwriter가 있으면 우선 사용, 없으면 openpyxl)
+try:
+    import xlsxwriter  # noqa: F401
+    XLSX_ENGINE = "xlsxwriter"
+except ImportError:
+    XLSX_ENGINE = "openpyxl"
+
 # 페이지 설정
 st.set_page_config(
     page_title="극지식물 EC 농도 연구",
@@ -23,107 +36,211 @@ html, body, [class*="css"] {
 </style>
 """, unsafe_allow_html=True)
 
-# 학교별 EC 설정
-SCHOOL_EC = {
-    "송도고": {"ec": 1.0, "color": "#4A90E2"},
-    "하늘고": {"ec": 2.0, "color": "#50C878"},
-    "아라고": {"ec": 4.0, "color": "#FFB347"},
-    "동산고": {"ec": 8.0, "color": "#FF6B6B"}
-}
+# 그래프 한글 폰트 설정
+KOREAN_FONT = dict(family="Malgun Gothic, Apple SD Gothic Neo, sans-serif")
 
-def normalize_both(text):
-    """텍스트를 NFC와 NFD로 정규화"""
-    return (unicodedata.normalize("NFC", text), 
-            unicodedata.normalize("NFD", text))
+# 시계열 그래프 최대 표시 점 개수
+TS_MAX_POINTS = 2000
 
-@st.cache_data
-def load_environment_data():
-    """환경 데이터 로딩"""
-    data_dir = Path("data")
-    env_data = {}
-    
-    if not data_dir.exists():
-        st.error(f"data 폴더가 없습니다. 현재 위치: {Path.cwd()}")
-        return None
-    
-    # 모든 파일 나열
-    all_files = list(data_dir.iterdir())
-    csv_files = [f for f in all_files if f.suffix.lower() == '.csv']
-    
-    if not csv_files:
-        st.error(f"CSV 파일이 없습니다. 폴더 내 파일: {[f.name for f in all_files]}")
-        return None
-    
-    # 각 CSV 파일 처리
-    for csv_path in csv_files:
-        fname_nfc, fname_nfd = normalize_both(csv_path.stem)
+def lttb_indices(y, n_out):
+    """LTTB(Largest-Triangle-Three-Buckets)로 시계열을 n_out개 점으로 줄일 위치 계산"""
+    y = np.asarray(y, dtype=np.float64)
+    n = len(y)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+    
+    x = np.arange(n, dtype=np.float64)
+    # 첫/마지막 점을 제외한 나머지를 n_out - 2개 구간으로 분할
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    idx = np.empty(n_out, dtype=np.int64)
+    idx[0], idx[-1] = 0, n - 1
+    
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
         
-        for school in SCHOOL_EC.keys():
-            school_nfc, school_nfd = normalize_both(school)
-            
-            # 매칭 확인
-            if (school_nfc in fname_nfc or school_nfd in fname_nfd):
-                try:
-                    df = pd.read_csv(csv_path, encoding='utf-8-sig')
-                    env_data[school] = df
-                    break
-                except:
-                    try:
-                        df = pd.read_csv(csv_path, encoding='cp949')
-                        env_data[school] = df
-                        break
-                    except Exception as e:
-                        st.warning(f"{csv_path.name} 로딩 실패: {e}")
-    
-    return env_data if len(env_data) > 0 else None
+        # 이전 선택점, 다음 구간 평균점과 이루는 삼각형 넓이가 최대인 점 선택
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a])
+                      - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        idx[i + 1] = a
+    
+    return idx
 
-@st.cache_data
-def load_growth_data():
-    """생육 결과 데이터 로딩"""
-    data_dir = Path("data")
-    
-    if not data_dir.exists():
-        st.error("data 폴더가 없습니다.")
-        return None
-    
-    # 엑셀 파일 찾기
-    all_files = list(data_dir.iterdir())
-    excel_files = [f for f in all_files if f.suffix.lower() in ['.xlsx', '.xls']]
-    
-    if not excel_files:
-        st.error(f"엑셀 파일이 없습니다. 폴더 내 파일: {[f.name for f in all_files]}")
-        return None
-    
-    # 첫 번째 엑셀 파일 사용
-    excel_path = excel_files[0]
-    
-    try:
-        # 모든 시트 읽기
-        excel_file = pd.ExcelFile(excel_path, engine='openpyxl')
-        growth_data = {}
-        
-        for sheet_name in excel_file.sheet_names:
-            sheet_nfc, sheet_nfd = normalize_both(sheet_name)
+@st.cache_data(show_spinner=False)
+def downsample_series(series: pd.Series, n_out: int):
+    """시계열을 LTTB로 최대 n_out개 점으로 줄인 (x, y) 배열 반환"""
+    idx = lttb_indices(series, n_out)
+    return series.index.to_numpy()[idx], series.to_numpy()[idx]
+
+@st.cache_resource(show_spinner=False)
+def build_env_subplot(env_summary):
+    """학교별 환경 평균 비교 2x2 그래프 생성"""
+    # 2x2 서브플롯 생성
+    fig = make_subplots(
+        rows=2, cols=2,
+        subplot_titles=("평균 온도 (°C)", "평균 습도 (%)", "평균 pH", "목표 EC vs 실측 EC"),
+        vertical_spacing=0.12,
+        horizontal_spacing=0.1
+    )
+    
+    schools_list = list(SCHOOL_EC.keys())
+    colors = [SCHOOL_EC[s]['color'] for s in schools_list]
+    
+    fig.add_traces(
+        [
+            # 온도
+            go.Bar(x=schools_list, y=env_summary['평균 온도'], 
+                   marker_color=colors, name="온도", showlegend=False),
+            # 습도
+            go.Bar(x=schools_list, y=env_summary['평균 습도'], 
+                   marker_color=colors, name="습도", showlegend=False),
+            # pH
+            go.Bar(x=schools_list, y=env_summary['평균 pH'], 
+                   marker_color=colors, name="pH", showlegend=False),
+            # EC 비교
+            go.Bar(x=schools_list, y=env_summary['목표 EC'], 
+                   name="목표 EC", marker_color="lightgray"),
+            go.Bar(x=schools_list, y=env_summary['평균 EC'], 
+                   name="실측 EC", marker_color=colors),
+        ],
+        rows=[1, 1, 2, 2, 2], cols=[1, 2, 1, 2, 2]
+    )
+    
+    fig.update_layout(
+        height=600,
+        font=KOREAN_FONT,
+        showlegend=True
+    )
+    
+    return fig
+
+@st.cache_resource(show_spinner=False)
+def build_growth_box(growth_long_df):
+    """학교별 생중량 분포 상자 그림 생성"""
+    box_labels = {school: f"{school} (EC {info['ec']})" for school, info in SCHOOL_EC.items()}
+    
+    fig_box = px.box(
+        growth_long_df.assign(label=growth_long_df['school'].map(box_labels)),
+        x='label', y='생중량(g)', color='label',
+        color_discrete_map={box_labels[s]: color for s, color in COLOR_MAP.items()},
+        category_orders={'label': list(box_labels.values())}
+    )
+    
+    fig_box.update_layout(
+        xaxis_title=None,
+        legend_title_text=None,
+        yaxis_title="생중량 (g)",
+        boxmode='overlay',
+        font=KOREAN_FONT,
+        height=400
+    )
+    
+    return fig_box
+
+@st.cache_resource(show_spinner=False)
+def build_growth_corr(growth_long_df):
+    """잎 수/지상부 길이 vs 생중량 1x2 산점도 생성"""
+    by_school = dict(tuple(growth_long_df.groupby('school', observed=True)))
+    fig_corr = make_subplots(
+        rows=1, cols=2,
+        subplot_titles=("잎 수 vs 생중량", "지상부 길이 vs 생중량"),
+        horizontal_spacing=0.1
+    )
+    
+    corr_x = ['잎 수(장)', '지상부 길이(mm)']
+    fig_corr.add_traces(
+        [
+            go.Scattergl(
+                x=by_school[school][x_col],
+                y=by_school[school]['생중량(g)'],
+                mode='markers',
+                name=school,
+                legendgroup=school,
+                showlegend=(col == 1),
+                marker=dict(color=SCHOOL_EC[school]['color'], size=8)
+            )
+            for col, x_col in enumerate(corr_x, start=1)
+            for school in SCHOOL_EC.keys()
+        ],
+        rows=1, cols=[col for col in (1, 2) for _ in SCHOOL_EC]
+    )
+    
+    fig_corr.update_xaxes(title_text="잎 수 (장)", row=1, col=1)
+    fig_corr.update_xaxes(title_text="지상부 길이 (mm)", row=1, col=2)
+    fig_corr.update_yaxes(title_text="생중량 (g)", row=1, col=1)
+    
+    fig_corr.update_layout(
+        font=KOREAN_FONT,
+        height=400
+    )
+    
+    return fig_corr
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def build_workbook(sheets: dict) -> bytes:
+    """{시트명: 데이터프레임}을 하나의 XLSX 바이트로 변환"""
+    buffer = io.BytesIO()
+    with pd.ExcelWriter(buffer, engine=XLSX_ENGINE) as writer:
+        for sheet_name, df in sheets.items():
+            df.to_excel(writer, index=False, sheet_name=sheet_name)
+    return buffer.getvalue()
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """데이터프레임을 CSV 바이트로 변환 (엑셀 호환 BOM 포함)"""
+    return df.to_csv(index=False).encode('utf-8-sig')
+
+@st.fragment
+def show_env_raw(env_data, selected_school):
+    """환경 데이터 원본 표시 (위젯 조작 시 이 영역만 재실행)"""
+    with st.expander("환경 데이터 원본 보기"):
+        if selected_school == "전체":
+            for school in SCHOOL_EC.keys():
+                st.write(f"**{school}**")
+                st.dataframe(env_data[school], use_container_width=True)
+        else:
+            st.dataframe(env_data[selected_school], use_container_width=True)
             
+            # CSV 다운로드
+            csv = to_csv_bytes(env_data[selected_school])
+            st.download_button(
+                label="CSV 다운로드",
+                data=csv,
+                file_name=f"{selected_school}_환경데이터.csv",
+                mime="text/csv",
+                on_click="ignore"
+            )
+
+@st.fragment
+def show_growth_raw(growth_data, selected_school):
+    """생육 데이터 원본 표시 (위젯 조작 시 이 영역만 재실행)"""
+    with st.expander("생육 데이터 원본 보기"):
+        if selected_school == "전체":
             for school in SCHOOL_EC.keys():
-                school_nfc, school_nfd = normalize_both(school)
-                
-                # 시트명에 학교명 포함 여부 확인
-                if (school_nfc in sheet_nfc or school_nfd in sheet_nfd):
-                    df = pd.read_excel(excel_path, sheet_name=sheet_name, engine='openpyxl')
-                    growth_data[school] = df
-                    break
-        
-        return growth_data if len(growth_data) > 0 else None
-        
-    except Exception as e:
-        st.error(f"엑셀 파일 읽기 실패: {e}")
-        return None
+                st.write(f"**{school}** (개체수: {len(growth_data[school])})")
+                st.dataframe(growth_data[school], use_container_width=True)
+        else:
+            st.dataframe(growth_data[selected_school], use_container_width=True)
+            
+            # XLSX 다운로드
+            xlsx = build_workbook({selected_school: growth_data[selected_school]})
+            
+            st.download_button(
+                label="XLSX 다운로드",
+                data=xlsx,
+                file_name=f"{selected_school}_생육데이터.xlsx",
+                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                on_click="ignore"
+            )
 
 # 데이터 로딩
 with st.spinner("데이터를 불러오는 중..."):
-    env_data = load_environment_data()
-    growth_data = load_growth_data()
+    env_data, env_stats = load_environment_data()
+    growth_data, growth_long_df, growth_stats = load_growth_data()
 
 # 데이터 확인
 if env_data is None or growth_data is None:
@@ -144,6 +261,10 @@ if env_data is None or growth_data is None:
     
     st.stop()
 
+# 학교별 집계
+env_stats = env_stats.reindex(list(SCHOOL_EC.keys()))
+growth_stats = growth_stats.reindex(list(SCHOOL_EC.keys()))
+
 # 타이틀
 st.title("🌱 극지식물 최적 EC 농도 연구")
 
@@ -181,7 +302,7 @@ with tab1:
     # EC 조건 표
     ec_df = pd.DataFrame([
         {"학교": school, "목표 EC": f"{info['ec']} dS/m", 
-         "개체수": len(growth_data[school]), "색상": info['color']}
+         "개체수": growth_stats.loc[school, '개체수'], "색상": info['color']}
         for school, info in SCHOOL_EC.items()
     ])
     
@@ -191,14 +312,12 @@ with tab1:
     st.subheader("주요 지표")
     col1, col2, col3, col4 = st.columns(4)
     
-    total_plants = sum(len(df) for df in growth_data.values())
-    avg_temp = sum(env_data[s]['temperature'].mean() for s in env_data) / len(env_data)
-    avg_humidity = sum(env_data[s]['humidity'].mean() for s in env_data) / len(env_data)
+    total_plants = int(growth_stats['개체수'].sum())
+    avg_temp = env_stats['평균 온도'].mean()
+    avg_humidity = env_stats['평균 습도'].mean()
     
     # 최적 EC 찾기 (평균 생중량 기준)
-    avg_weights = {school: growth_data[school]['생중량(g)'].mean() 
-                   for school in SCHOOL_EC.keys()}
-    optimal_school = max(avg_weights, key=avg_weights.get)
+    optimal_school = growth_stats['평균 생중량'].idxmax()
     optimal_ec = SCHOOL_EC[optimal_school]['ec']
     
     col1.metric("총 개체수", f"{total_plants}개")
@@ -213,66 +332,9 @@ with tab2:
     # 학교별 환경 평균 비교
     st.subheader("학교별 환경 평균 비교")
     
-    env_summary = pd.DataFrame({
-        school: {
-            '평균 온도': env_data[school]['temperature'].mean(),
-            '평균 습도': env_data[school]['humidity'].mean(),
-            '평균 pH': env_data[school]['ph'].mean(),
-            '평균 EC': env_data[school]['ec'].mean(),
-            '목표 EC': SCHOOL_EC[school]['ec']
-        }
-        for school in SCHOOL_EC.keys()
-    }).T
+    env_summary = env_stats.assign(**{'목표 EC': [SCHOOL_EC[s]['ec'] for s in env_stats.index]})
     
-    # 2x2 서브플롯 생성
-    fig = make_subplots(
-        rows=2, cols=2,
-        subplot_titles=("평균 온도 (°C)", "평균 습도 (%)", "평균 pH", "목표 EC vs 실측 EC"),
-        vertical_spacing=0.12,
-        horizontal_spacing=0.1
-    )
-    
-    schools_list = list(SCHOOL_EC.keys())
-    colors = [SCHOOL_EC[s]['color'] for s in schools_list]
-    
-    # 온도
-    fig.add_trace(
-        go.Bar(x=schools_list, y=env_summary['평균 온도'], 
-               marker_color=colors, name="온도", showlegend=False),
-        row=1, col=1
-    )
-    
-    # 습도
-    fig.add_trace(
-        go.Bar(x=schools_list, y=env_summary['평균 습도'], 
-               marker_color=colors, name="습도", showlegend=False),
-        row=1, col=2
-    )
-    
-    # pH
-    fig.add_trace(
-        go.Bar(x=schools_list, y=env_summary['평균 pH'], 
-               marker_color=colors, name="pH", showlegend=False),
-        row=2, col=1
-    )
-    
-    # EC 비교
-    fig.add_trace(
-        go.Bar(x=schools_list, y=env_summary['목표 EC'], 
-               name="목표 EC", marker_color="lightgray"),
-        row=2, col=2
-    )
-    fig.add_trace(
-        go.Bar(x=schools_list, y=env_summary['평균 EC'], 
-               name="실측 EC", marker_color=colors),
-        row=2, col=2
-    )
-    
-    fig.update_layout(
-        height=600,
-        font=dict(family="Malgun Gothic, Apple SD Gothic Neo, sans-serif"),
-        showlegend=True
-    )
+    fig = build_env_subplot(env_summary)
     
     st.plotly_chart(fig, use_container_width=True)
     
@@ -289,26 +351,19 @@ with tab2:
             vertical_spacing=0.08
         )
         
-        # 온도
-        fig_ts.add_trace(
-            go.Scatter(x=school_env.index, y=school_env['temperature'], 
-                      mode='lines', name='온도', line=dict(color='#FF6B6B')),
-            row=1, col=1
-        )
-        
-        # 습도
-        fig_ts.add_trace(
-            go.Scatter(x=school_env.index, y=school_env['humidity'], 
-                      mode='lines', name='습도', line=dict(color='#4A90E2')),
-            row=2, col=1
-        )
+        # 온도, 습도, EC (표시 점 개수를 넘으면 LTTB로 다운샘플링)
+        ts_series = [('temperature', '온도', '#FF6B6B'),
+                     ('humidity', '습도', '#4A90E2'),
+                     ('ec', '실측 EC', '#50C878')]
+        ts_traces = []
+        for column, name, color in ts_series:
+            x, y = downsample_series(school_env[column], TS_MAX_POINTS)
+            ts_traces.append(
+                go.Scattergl(x=x, y=y, 
+                             mode='lines', name=name, line=dict(color=color))
+            )
         
-        # EC
-        fig_ts.add_trace(
-            go.Scatter(x=school_env.index, y=school_env['ec'], 
-                      mode='lines', name='실측 EC', line=dict(color='#50C878')),
-            row=3, col=1
-        )
+        fig_ts.add_traces(ts_traces, rows=[1, 2, 3], cols=[1, 1, 1])
         
         # 목표 EC 선
         target_ec = SCHOOL_EC[selected_school]['ec']
@@ -324,29 +379,14 @@ with tab2:
         
         fig_ts.update_layout(
             height=800,
-            font=dict(family="Malgun Gothic, Apple SD Gothic Neo, sans-serif"),
+            font=KOREAN_FONT,
             showlegend=False
         )
         
         st.plotly_chart(fig_ts, use_container_width=True)
     
     # 환경 데이터 원본
-    with st.expander("환경 데이터 원본 보기"):
-        if selected_school == "전체":
-            for school in SCHOOL_EC.keys():
-                st.write(f"**{school}**")
-                st.dataframe(env_data[school], use_container_width=True)
-        else:
-            st.dataframe(env_data[selected_school], use_container_width=True)
-            
-            # CSV 다운로드
-            csv = env_data[selected_school].to_csv(index=False).encode('utf-8-sig')
-            st.download_button(
-                label="CSV 다운로드",
-                data=csv,
-                file_name=f"{selected_school}_환경데이터.csv",
-                mime="text/csv"
-            )
+    show_env_raw(env_data, selected_school)
 
 # Tab 3: 생육 결과
 with tab3:
@@ -355,32 +395,29 @@ with tab3:
     # 핵심 결과 카드
     st.subheader("🥇 EC별 평균 생중량")
     
+    card_df = pd.DataFrame({
+        'school': growth_stats.index,
+        'ec': [SCHOOL_EC[s]['ec'] for s in growth_stats.index],
+        'avg': growth_stats['평균 생중량'].to_numpy(),
+        'is_best': growth_stats.index == optimal_school
+    })
+    
     cols = st.columns(4)
-    for idx, school in enumerate(SCHOOL_EC.keys()):
-        avg_weight = growth_data[school]['생중량(g)'].mean()
-        ec_value = SCHOOL_EC[school]['ec']
-        
-        with cols[idx]:
-            if school == optimal_school:
-                st.success(f"**{school}** (EC {ec_value})")
-                st.metric("평균 생중량", f"{avg_weight:.2f}g", delta="최적 ⭐")
+    for col, card in zip(cols, card_df.itertuples(index=False)):
+        with col:
+            if card.is_best:
+                st.success(f"**{card.school}** (EC {card.ec})")
+                st.metric("평균 생중량", f"{card.avg:.2f}g", delta="최적 ⭐")
             else:
-                st.info(f"**{school}** (EC {ec_value})")
-                st.metric("평균 생중량", f"{avg_weight:.2f}g")
+                st.info(f"**{card.school}** (EC {card.ec})")
+                st.metric("평균 생중량", f"{card.avg:.2f}g")
     
     # EC별 생육 비교 (2x2)
     st.subheader("EC별 생육 비교")
     
-    growth_summary = pd.DataFrame({
-        school: {
-            '평균 생중량': growth_data[school]['생중량(g)'].mean(),
-            '평균 잎 수': growth_data[school]['잎 수(장)'].mean(),
-            '평균 지상부 길이': growth_data[school]['지상부 길이(mm)'].mean(),
-            '개체수': len(growth_data[school]),
-            'EC': SCHOOL_EC[school]['ec']
-        }
-        for school in SCHOOL_EC.keys()
-    }).T.sort_values('EC')
+    growth_summary = growth_stats.assign(
+        EC=[SCHOOL_EC[s]['ec'] for s in growth_stats.index]
+    ).sort_values('EC')
     
     fig_growth = make_subplots(
         rows=2, cols=2,
@@ -393,37 +430,19 @@ with tab3:
     schools_sorted = growth_summary.index.tolist()
     colors_sorted = [SCHOOL_EC[s]['color'] for s in schools_sorted]
     
-    # 생중량
-    fig_growth.add_trace(
-        go.Bar(x=schools_sorted, y=growth_summary['평균 생중량'], 
-               marker_color=colors_sorted, showlegend=False),
-        row=1, col=1
-    )
-    
-    # 잎 수
-    fig_growth.add_trace(
-        go.Bar(x=schools_sorted, y=growth_summary['평균 잎 수'], 
-               marker_color=colors_sorted, showlegend=False),
-        row=1, col=2
-    )
-    
-    # 지상부 길이
-    fig_growth.add_trace(
-        go.Bar(x=schools_sorted, y=growth_summary['평균 지상부 길이'], 
-               marker_color=colors_sorted, showlegend=False),
-        row=2, col=1
-    )
-    
-    # 개체수
-    fig_growth.add_trace(
-        go.Bar(x=schools_sorted, y=growth_summary['개체수'], 
-               marker_color=colors_sorted, showlegend=False),
-        row=2, col=2
+    # 생중량, 잎 수, 지상부 길이, 개체수
+    fig_growth.add_traces(
+        [
+            go.Bar(x=schools_sorted, y=growth_summary[metric], 
+                   marker_color=colors_sorted, showlegend=False)
+            for metric in ['평균 생중량', '평균 잎 수', '평균 지상부 길이', '개체수']
+        ],
+        rows=[1, 1, 2, 2], cols=[1, 2, 1, 2]
     )
     
     fig_growth.update_layout(
         height=600,
-        font=dict(family="Malgun Gothic, Apple SD Gothic Neo, sans-serif")
+        font=KOREAN_FONT
     )
     
     st.plotly_chart(fig_growth, use_container_width=True)
@@ -431,94 +450,19 @@ with tab3:
     # 생중량 분포
     st.subheader("학교별 생중량 분포")
     
-    fig_box = go.Figure()
-    
-    for school in SCHOOL_EC.keys():
-        fig_box.add_trace(go.Box(
-            y=growth_data[school]['생중량(g)'],
-            name=f"{school} (EC {SCHOOL_EC[school]['ec']})",
-            marker_color=SCHOOL_EC[school]['color']
-        ))
-    
-    fig_box.update_layout(
-        yaxis_title="생중량 (g)",
-        font=dict(family="Malgun Gothic, Apple SD Gothic Neo, sans-serif"),
-        height=400
-    )
+    fig_box = build_growth_box(growth_long_df)
     
     st.plotly_chart(fig_box, use_container_width=True)
     
     # 상관관계 분석
     st.subheader("상관관계 분석")
     
-    col1, col2 = st.columns(2)
+    fig_corr = build_growth_corr(growth_long_df)
     
-    with col1:
-        fig_corr1 = go.Figure()
-        
-        for school in SCHOOL_EC.keys():
-            df_school = growth_data[school]
-            fig_corr1.add_trace(go.Scatter(
-                x=df_school['잎 수(장)'],
-                y=df_school['생중량(g)'],
-                mode='markers',
-                name=school,
-                marker=dict(color=SCHOOL_EC[school]['color'], size=8)
-            ))
-        
-        fig_corr1.update_layout(
-            title="잎 수 vs 생중량",
-            xaxis_title="잎 수 (장)",
-            yaxis_title="생중량 (g)",
-            font=dict(family="Malgun Gothic, Apple SD Gothic Neo, sans-serif"),
-            height=400
-        )
-        
-        st.plotly_chart(fig_corr1, use_container_width=True)
-    
-    with col2:
-        fig_corr2 = go.Figure()
-        
-        for school in SCHOOL_EC.keys():
-            df_school = growth_data[school]
-            fig_corr2.add_trace(go.Scatter(
-                x=df_school['지상부 길이(mm)'],
-                y=df_school['생중량(g)'],
-                mode='markers',
-                name=school,
-                marker=dict(color=SCHOOL_EC[school]['color'], size=8)
-            ))
-        
-        fig_corr2.update_layout(
-            title="지상부 길이 vs 생중량",
-            xaxis_title="지상부 길이 (mm)",
-            yaxis_title="생중량 (g)",
-            font=dict(family="Malgun Gothic, Apple SD Gothic Neo, sans-serif"),
-            height=400
-        )
-        
-        st.plotly_chart(fig_corr2, use_container_width=True)
+    st.plotly_chart(fig_corr, use_container_width=True)
     
     # 생육 데이터 원본
-    with st.expander("생육 데이터 원본 보기"):
-        if selected_school == "전체":
-            for school in SCHOOL_EC.keys():
-                st.write(f"**{school}** (개체수: {len(growth_data[school])})")
-                st.dataframe(growth_data[school], use_container_width=True)
-        else:
-            st.dataframe(growth_data[selected_school], use_container_width=True)
-            
-            # XLSX 다운로드
-            buffer = io.BytesIO()
-            growth_data[selected_school].to_excel(buffer, index=False, engine="openpyxl")
-            buffer.seek(0)
-            
-            st.download_button(
-                label="XLSX 다운로드",
-                data=buffer,
-                file_name=f"{selected_school}_생육데이터.xlsx",
-                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-            )
+    show_growth_raw(growth_data, selected_school)
 
 # 푸터
 st.markdown("---")